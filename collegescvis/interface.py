@@ -16,11 +16,18 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import json
+import os
+import pickle
 import sqlite3
 from matplotlib.backends.backend_qt4agg import FigureCanvasQTAgg as FigureCanvas
 import matplotlib.pyplot as plt
+import numpy as np
 from PyQt4 import QtCore, QtGui
 
+#Sentinel marking a (college, data_type, year) combination with no
+#database row, as distinct from a row holding NULL (None).
+_MISSING = object()
+
 
 class Interface(object):
     """Top-level class that contains all other interface classes.
@@ -62,6 +69,11 @@ class MainWindow(QtGui.QMainWindow):
         QtGui.QMainWindow.__init__(self)
         self.parent = parent
 
+        #Axes are pooled and reused across plot updates because twinx
+        #triggers a full figure layout pass on every call.
+        self._parent_axes = None
+        self._ax_pool = []
+
         self.figure = self._build_figure()
         self.canvas = FigureCanvas(self.figure)
         self.setCentralWidget(self.canvas)
@@ -75,6 +87,8 @@ class MainWindow(QtGui.QMainWindow):
             figure: figure containing the initial axes object(s).
         """
         figure = plt.figure()
+        #Raster resolution for the rasterized point artists on export.
+        figure.set_dpi(150)
         title_text = (
             'Use the menubar above (Plot => New Plot) to plot data.')
         figure.suptitle(title_text, fontsize=14, y=0.5)
@@ -90,65 +104,83 @@ class MainWindow(QtGui.QMainWindow):
         and shapes to differentiate between datasets. If no data exists for
         a user-requested plot, it is skipped and the user is alerted with a
         message box.
+
+        All axes mutations happen without triggering intermediate
+        redraws; the canvas is drawn exactly once at the end.
         """
         colors = ['b', 'g', 'r', 'c', 'm', 'y', 'k']
         markers = ['o', 's', '^']
 
-        #Clear the figure
-        for plot in self.figure.get_axes():
-            self.figure.delaxes(plot)
-        self.figure.suptitle('')
-
-        #Parent axes created to share x axis with other axes
-        parent_axes = self._build_parent_axes()
-
-        #Add twinned axes until number of axes equals number of series
-        ax_list = [parent_axes]
-        series_list = self.parent.plot_settings._get_series_plots()
-        if len(series_list) > 1:
-            for series in series_list[1:]:
-                ax_list.append(parent_axes.twinx())
-
-        count = 0
-        for index, series in enumerate(series_list):
-            x_data, y_data = series._get_xy_data()
-
-            #Skip if data does not exist
-            if len(y_data) == 0 or (len(y_data) == 1 and y_data[0] is None):
-                ax_list[index].set_axis_off()
-                self._create_popup(
-                    series.data_type + ' data does not exist for ' +
-                    series.college + ' for years ' + series.start_year + '-' +
-                    series.end_year + '. Data will not appear in plot.')
-                continue
-
-            #Plot the data
-            ax_label = series.college + ' ' + series.data_type
-            color = colors[count%len(colors)]
-            marker = markers[int(count/len(colors))]
-            ax_list[index].scatter(
-                x_data, y_data, c=color, marker=marker, label=ax_label)
-
-            #Configure the y axis
-            ax_list[index].set_ylim(self._get_y_limits(y_data))
-            ax_list[index].set_ylabel(series.data_type, color=color)
-            ax_list[index].ticklabel_format(axis='y', useOffset=False)
-            ax_list[index].tick_params(axis='y', colors=color)
-
-            #Adjust the plot for new y axes
-            if count > 1:
-                self.figure.subplots_adjust(right=0.9 - 0.025 * count)
-                ax_list[index].spines['right'].set_position(
-                    ('axes', 0.95 + .07 * count))
-            count = count + 1
-
-        #Create the legend
-        lines, labels = [], []
-        for axes in ax_list:
-            ax_lines, ax_labels = axes.get_legend_handles_labels()
-            lines += ax_lines
-            labels += ax_labels
-        parent_axes.legend(lines, labels, loc='upper right')
+        with plt.rc_context(
+                {'path.simplify': True, 'path.simplify_threshold': 1.0}):
+            self.figure.suptitle('')
+
+            #Parent axes created to share x axis with other axes
+            parent_axes = self._build_parent_axes()
+
+            #Reuse pooled twinned axes until number of axes equals number
+            #of series, growing the pool only when the series count does
+            series_list = self.parent.plot_settings._get_series_plots()
+            twins_needed = max(len(series_list) - 1, 0)
+            while len(self._ax_pool) < twins_needed:
+                self._ax_pool.append(parent_axes.twinx())
+            for axes in self._ax_pool[:twins_needed]:
+                axes.clear()
+                axes.set_visible(True)
+            for axes in self._ax_pool[twins_needed:]:
+                axes.set_visible(False)
+            ax_list = [parent_axes] + self._ax_pool[:twins_needed]
+
+            count = 0
+            legend_handles, legend_labels = [], []
+            for index, series in enumerate(series_list):
+                x_data, y_data = series._get_xy_data()
+
+                #Skip if data does not exist
+                if len(y_data) == 0 or (len(y_data) == 1 and (
+                        y_data[0] is None or np.isnan(y_data[0]))):
+                    ax_list[index].set_axis_off()
+                    self._create_popup(
+                        series.data_type + ' data does not exist for ' +
+                        series.college + ' for years ' + series.start_year +
+                        '-' + series.end_year +
+                        '. Data will not appear in plot.')
+                    continue
+
+                #Plot the data
+                ax_label = series.college + ' ' + series.data_type
+                color = colors[count%len(colors)]
+                marker = markers[int(count/len(colors))]
+                #Limits are set explicitly below, so skip autoscaling
+                ax_list[index].set_autoscale_on(False)
+                #plot draws a single-color marker set much faster than
+                #scatter, which builds a PathCollection with per-point
+                #color and size arrays the series never uses
+                handle, = ax_list[index].plot(
+                    x_data, y_data, linestyle='None', marker=marker,
+                    color=color, label=ax_label, rasterized=True)
+                legend_handles.append(handle)
+                legend_labels.append(ax_label)
+
+                #Configure the y axis
+                ax_list[index].set_ylim(self._get_y_limits(y_data))
+                ax_list[index].set_ylabel(series.data_type, color=color)
+                ax_list[index].ticklabel_format(axis='y', useOffset=False)
+                ax_list[index].tick_params(axis='y', colors=color)
+
+                #Adjust the plot for new y axes
+                if count > 1:
+                    self.figure.subplots_adjust(right=0.9 - 0.025 * count)
+                    ax_list[index].spines['right'].set_position(
+                        ('axes', 0.95 + .07 * count))
+                count = count + 1
+
+            #Create the legend from the handles collected while plotting
+            parent_axes.legend(
+                legend_handles, legend_labels, loc='upper right')
+
+        #One draw for the whole update instead of one per mutation
+        self.canvas.draw_idle()
 
     @staticmethod
     def _get_y_limits(y_data):
@@ -162,9 +194,11 @@ class MainWindow(QtGui.QMainWindow):
         """
         min_scale = 0.9
         max_scale = 1.1
-        clean_y_data = [y for y in y_data if y != None]
-        y_min = min(clean_y_data)*min_scale
-        y_max = max(clean_y_data)*max_scale
+        #Drop missing values; asarray maps None to NaN for College data
+        clean_y_data = np.asarray(y_data, dtype=float)
+        clean_y_data = clean_y_data[~np.isnan(clean_y_data)]
+        y_min = clean_y_data.min()*min_scale
+        y_max = clean_y_data.max()*max_scale
         return (y_min, y_max)
 
     @staticmethod
@@ -186,12 +220,21 @@ class MainWindow(QtGui.QMainWindow):
     def _build_parent_axes(self):
         """Build a parent axes to hold the x axis shared by all the plots.
 
+        The axes is created once and cleared on later calls, since
+        removing and recreating it would also invalidate the pooled
+        twinned axes that share its x axis.
+
         Returns:
             parent_axes: Axes object with correct x axis scale.
         """
-        parent_axes = plt.subplot()
-        x_min = int(self.parent.plot_settings._get_year_range()[0]) - 1
-        x_max = int(self.parent.plot_settings._get_year_range()[1]) + 1
+        if self._parent_axes is None:
+            self._parent_axes = self.figure.add_subplot(111)
+        else:
+            self._parent_axes.clear()
+        parent_axes = self._parent_axes
+        min_year, max_year = self.parent.plot_settings._get_year_range()
+        x_min = int(min_year) - 1
+        x_max = int(max_year) + 1
         parent_axes.set_xlim([x_min, x_max])
         parent_axes.ticklabel_format(axis='x', useOffset=False)
         parent_axes.set_xticks([year for year in range(x_min, x_max+1)])
@@ -205,7 +248,16 @@ class MainWindow(QtGui.QMainWindow):
                 'No valid data to export found. Please try again.')
             return
         data = self.parent.plot_settings._get_series_plots()
-        json_list = [entry.__dict__ for entry in data]
+        json_list = []
+        for entry in data:
+            entry_dict = dict(entry.__dict__)
+            if isinstance(entry_dict['data'], np.ndarray):
+                #Map NaN back to None so missing values export as null;
+                #json.dump would write NaN, which is not valid JSON.
+                entry_dict['data'] = [
+                    None if value != value else value
+                    for value in entry_dict['data'].tolist()]
+            json_list.append(entry_dict)
         filename = QtGui.QFileDialog.getSaveFileName(
             self, 'Save File', '', '*.json')
         with open(filename, 'w') as save_file:
@@ -244,59 +296,271 @@ class PlotSettings(object):
         college_names: List of valid college name strings.
         year_names: List of valid year strings.
         data_types: List of valid data type strings.
+        year_data_types: Subset of data_types whose columns live in the
+            year tables rather than the College table.
         series_plots: List of SeriesPlots specified by the user.
     """
 
     def __init__(self, db_path):
-        self.cur = sqlite3.connect(db_path).cursor()
+        self.conn = sqlite3.connect(db_path, cached_statements=256)
+        self.cur = self.conn.cursor()
+        self._set_db_pragmas()
+
+        #Maps (data_type, years) to a built query string so repeated
+        #plots skip the string construction in _query_db.
+        self._stmt_cache = {}
+
+        #Session cache of fetched values keyed (college, data_type,
+        #year). Users who tweak one series among many and re-plot only
+        #query the database for cells not already fetched.
+        self._series_cache = {}
 
         #Data is stored in PlotSettings to prevent repeated db calls.
         self.college_names = []
         self.year_names = []
         self.data_types = []
+        self.year_data_types = []
+
+        #The metadata only changes when the database is regenerated, so
+        #reuse a snapshot keyed to the database's mtime when one exists.
+        metadata_loaded = self._load_metadata(db_path)
+        if not metadata_loaded:
+            self._get_college_names()
+            self._get_year_names()
+            self._get_data_types()
 
-        self._get_college_names()
-        self._get_year_names()
-        self._get_data_types()
+        #Whitelists for the identifiers interpolated into query strings
+        self._data_types_set = frozenset(self.data_types)
+        self._year_names_set = frozenset(self.year_names)
+        self._year_data_types_set = frozenset(self.year_data_types)
+
+        self._create_indexes()
+
+        #Save after index creation so the snapshot key reflects the
+        #database file's final modification time.
+        if not metadata_loaded:
+            self._save_metadata(db_path)
+
+        #Nothing writes to the database after the indexes are built.
+        self.cur.execute('''PRAGMA query_only = 1''')
 
         self.max_college_data_index = 0
         self.series_plots = []
+        self._year_range = None
+
+    def _set_db_pragmas(self):
+        """Configure the connection for a read-only, repeated-query workload.
+
+        The defaults (synchronous=FULL, no mmap, small page cache) are
+        tuned for safe concurrent writes, which the visualizer never
+        does. Memory-mapped I/O and a larger cache let SQLite serve the
+        startup queries and plot queries straight from mapped pages.
+        """
+        self.cur.execute('''PRAGMA journal_mode = WAL''')
+        self.cur.execute('''PRAGMA synchronous = NORMAL''')
+        self.cur.execute('''PRAGMA mmap_size = 268435456''')
+        self.cur.execute('''PRAGMA cache_size = -65536''')
+        self.cur.execute('''PRAGMA temp_store = MEMORY''')
 
     def _query_db(self):
-        """Retrieve data from the database for each user-requested plot."""
-        for series in self.series_plots:
-            years = list(
-                range(int(series.start_year), int(series.end_year) + 1))
+        """Retrieve data from the database for each user-requested plot.
 
+        Series are grouped so that overlapping selections share queries:
+        all College-table series run as one query, and all year-table
+        series run as one query selecting the union of their columns for
+        the union of their colleges across the needed years. The fetched
+        values are then demultiplexed back into each series.
+        """
+        cells = self._fetch_series_cells()
+        for series in self.series_plots:
             if series.is_college:
-                self.cur.execute(
-                    '''SELECT %s FROM College WHERE INSTNM = ?''' %
-                    (series.data_type), (series.college,))
-                results = self.cur.fetchall()
-                if len(results) == 0:
+                key = (series.college, series.data_type, None)
+                if key not in cells:
                     print('No data found for series: ', series._to_string())
-                for value in results:
-                    series.data.append(value[0])
+                    continue
+                series.data.append(cells[key])
+
+            else:
+                values = []
+                for year in range(
+                        int(series.start_year), int(series.end_year) + 1):
+                    key = (series.college, series.data_type, str(year))
+                    if key in cells:
+                        values.append(cells[key])
+                if len(values) == 0:
+                    print('No data found for series: ', series._to_string())
+                #Fetch straight into a float array; NULLs become NaN so
+                #matplotlib receives the array without further conversion.
+                series.data = np.fromiter(
+                    (float('nan') if value is None else value
+                     for value in values),
+                    dtype=np.float64, count=len(values))
+
+    def _fetch_series_cells(self):
+        """Return the result cells for the current SeriesPlot list.
 
+        Cells already in the session cache are served from it; grouped
+        queries run only for the series with uncached cells. Absent
+        database rows are cached as missing so they are not re-queried
+        on every re-plot.
+
+        Returns:
+            cells: Dict mapping (college, data_type, year) to the value
+                fetched from the database. year is None for College
+                table data and a year string for year table data. Keys
+                with no data in the database are left out.
+        """
+        college_series = [
+            s for s in self.series_plots if s.is_college and
+            (s.college, s.data_type, None) not in self._series_cache]
+        year_series = [
+            s for s in self.series_plots if not s.is_college and any(
+                (s.college, s.data_type, str(year)) not in self._series_cache
+                for year in range(int(s.start_year), int(s.end_year) + 1))]
+
+        if college_series:
+            data_types = sorted({s.data_type for s in college_series})
+            colleges = sorted({s.college for s in college_series})
+            self.cur.execute(
+                self._get_stmt(tuple(data_types), None, len(colleges)),
+                colleges)
+            for row in self.cur.fetchall():
+                for offset, data_type in enumerate(data_types):
+                    self._series_cache[
+                        (row[0], data_type, None)] = row[offset + 1]
+            #Combinations the query covered but returned no row for are
+            #recorded as missing so they are not queried again.
+            for college in colleges:
+                for data_type in data_types:
+                    self._series_cache.setdefault(
+                        (college, data_type, None), _MISSING)
+
+        if year_series:
+            data_types = sorted({s.data_type for s in year_series})
+            colleges = sorted({s.college for s in year_series})
+            years = sorted({
+                str(year) for s in year_series for year in range(
+                    int(s.start_year), int(s.end_year) + 1)})
+            if years:
+                self.cur.execute(
+                    self._get_stmt(
+                        tuple(data_types), tuple(years), len(colleges)),
+                    colleges * len(years))
+                for row in self.cur.fetchall():
+                    for offset, data_type in enumerate(data_types):
+                        self._series_cache[
+                            (row[1], data_type, row[0])] = row[offset + 2]
+                for college in colleges:
+                    for data_type in data_types:
+                        for year in years:
+                            self._series_cache.setdefault(
+                                (college, data_type, year), _MISSING)
+
+        cells = {}
+        for series in self.series_plots:
+            if series.is_college:
+                keys = [(series.college, series.data_type, None)]
             else:
+                keys = [
+                    (series.college, series.data_type, str(year))
+                    for year in range(
+                        int(series.start_year), int(series.end_year) + 1)]
+            for key in keys:
+                value = self._series_cache.get(key, _MISSING)
+                if value is not _MISSING:
+                    cells[key] = value
+        return cells
+
+    def _get_stmt(self, data_types, years, college_count):
+        """Return the grouped query string, building it only once.
+
+        Args:
+            data_types: Tuple of data type column names to select.
+            years: Tuple of years covered by the query, or None for
+                year-independent data from the College table.
+            college_count: Number of college name parameters.
+
+        Returns:
+            Query string for the key. Cached so repeated plots of the
+            same selection skip the per-call string construction and
+            reuse sqlite3's compiled statement.
+
+        Raises:
+            ValueError: If a data type or year is not in the database
+                schema. Identifiers cannot be bound as parameters, so
+                anything not whitelisted is rejected before it reaches
+                the SQL string.
+        """
+        key = (data_types, years, college_count)
+        if key not in self._stmt_cache:
+            for data_type in data_types:
+                if data_type not in self._data_types_set:
+                    raise ValueError('Invalid data type: %s' % data_type)
+            if years is not None:
                 for year in years:
-                    self.cur.execute(
-                        '''SELECT %s FROM "%s" JOIN College WHERE
-                        "%s".college_id = College.college_id AND INSTNM = ?'''
-                        % (series.data_type, year, year), (series.college,))
-                    results = self.cur.fetchall()
-                    if len(results) == 0:
-                        print('No data found for series: ', series._to_string())
-                    for value in results:
-                        series.data.append(value[0])
+                    if year not in self._year_names_set:
+                        raise ValueError('Invalid year: %s' % year)
+            placeholders = ','.join('?' * college_count)
+            if years is None:
+                stmt = '''SELECT INSTNM, %s FROM College
+                    WHERE INSTNM IN (%s)''' % (
+                        ', '.join('"%s"' % data_type
+                                  for data_type in data_types),
+                        placeholders)
+            else:
+                #Combine the per-year queries into one statement so SQLite
+                #makes a single round-trip instead of one per year.
+                #Qualify each column against the table that defines it:
+                #College data types reach this branch because
+                #max_college_data_index is 0 at runtime, and one shared
+                #statement must not fail or turn ambiguous because of a
+                #mixed-in College column.
+                year_queries = [
+                    '''SELECT '%s' AS year, INSTNM, %s FROM "%s" JOIN College
+                    WHERE "%s".college_id = College.college_id
+                    AND INSTNM IN (%s)''' % (
+                        year,
+                        ', '.join(
+                            '"%s"."%s"' % (year, data_type)
+                            if data_type in self._year_data_types_set
+                            else 'College."%s"' % data_type
+                            for data_type in data_types),
+                        year, year, placeholders)
+                    for year in years]
+                stmt = ' UNION ALL '.join(year_queries) + ' ORDER BY year'
+            self._stmt_cache[key] = stmt
+        return self._stmt_cache[key]
+
+    def _create_indexes(self):
+        """Create the indexes used by the plotting queries.
+
+        Every query in _query_db filters College on INSTNM and joins the
+        year tables on college_id. Without indexes each lookup is a full
+        table scan, so build them once at startup. CREATE INDEX IF NOT
+        EXISTS makes this a no-op on every launch after the first.
+        """
+        self.cur.execute('''
+            CREATE INDEX IF NOT EXISTS idx_college_instnm
+            ON College(INSTNM)''')
+        for year in self.year_names:
+            self.cur.execute(
+                '''CREATE INDEX IF NOT EXISTS "idx_%s_cid"
+                ON "%s"(college_id)''' % (year, year))
+        self.conn.commit()
+        #Checkpoint the WAL into the main database file now; otherwise
+        #the checkpoint on close bumps the file's mtime after the
+        #metadata snapshot key has been recorded.
+        self.cur.execute('''PRAGMA wal_checkpoint(TRUNCATE)''')
 
     def _add_series_plot(self, series_plot):
         """Add a SeriesPlot object to the list."""
         self.series_plots.append(series_plot)
+        self._year_range = None
 
     def _clear_series_plots(self):
         """Clear the list of SeriesPlot objects."""
         self.series_plots = []
+        self._year_range = None
 
     def _get_series_plots(self):
         """Returns the list of SeriesPlot objects."""
@@ -305,10 +569,15 @@ class PlotSettings(object):
     def _get_year_range(self):
         """Return the data's min and max years from SeriesPlot list.
 
+        The result is cached until the SeriesPlot list changes so
+        repeated calls during a figure update do not rescan the series.
+
         Returns:
             (min_year, max_year): Tuple containing the string
                 min and max years from the dataset.
         """
+        if self._year_range is not None:
+            return self._year_range
         min_year = 10000
         max_year = 0
         for series in self.series_plots:
@@ -316,36 +585,99 @@ class PlotSettings(object):
                 min_year = int(series.start_year)
             if int(series.end_year) > max_year:
                 max_year = int(series.end_year)
-        return (str(min_year), str(max_year))
+        self._year_range = (str(min_year), str(max_year))
+        return self._year_range
+
+    def _load_metadata(self, db_path):
+        """Load the startup metadata snapshot if it matches the database.
+
+        Args:
+            db_path: String path of the database file.
+
+        Returns:
+            boolean: True if a snapshot keyed to the database's current
+                modification time was found and loaded.
+        """
+        meta_path = db_path + '.meta.pkl'
+        try:
+            with open(meta_path, 'rb') as meta_file:
+                snapshot = pickle.load(meta_file)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            return False
+        if snapshot.get('key') != self._get_metadata_key(db_path):
+            return False
+        try:
+            self.college_names = snapshot['college_names']
+            self.year_names = snapshot['year_names']
+            self.data_types = snapshot['data_types']
+            self.year_data_types = snapshot['year_data_types']
+            self.max_college_data_index = snapshot['max_college_data_index']
+        except KeyError:
+            #Snapshot from an older format; query the database instead.
+            return False
+        return True
+
+    def _save_metadata(self, db_path):
+        """Write the startup metadata snapshot next to the database.
+
+        Failure to write is not an error; the next launch simply
+        queries the database again.
+
+        Args:
+            db_path: String path of the database file.
+        """
+        snapshot = {
+            'key': self._get_metadata_key(db_path),
+            'college_names': self.college_names,
+            'year_names': self.year_names,
+            'data_types': self.data_types,
+            'year_data_types': self.year_data_types,
+            'max_college_data_index': self.max_college_data_index,
+        }
+        try:
+            with open(db_path + '.meta.pkl', 'wb') as meta_file:
+                pickle.dump(snapshot, meta_file)
+        except OSError:
+            pass
+
+    @staticmethod
+    def _get_metadata_key(db_path):
+        """Return the key identifying the database a snapshot matches.
+
+        Args:
+            db_path: String path of the database file.
+
+        Returns:
+            key: Tuple of the path and its modification time in
+                nanoseconds.
+        """
+        return (db_path, os.stat(db_path).st_mtime_ns)
 
     def _get_college_names(self):
         """Retrieve names of colleges from the database and store them."""
-        self.cur.execute('''
-            SELECT INSTNM FROM College ORDER BY INSTNM ASC''')
-        for result in self.cur.fetchall():
-            self.college_names.append(result[0])
+        #Iterate the cursor directly; fetchall would build an extra list
+        #of row tuples just to be thrown away.
+        self.college_names = [result[0] for result in self.cur.execute('''
+            SELECT INSTNM FROM College ORDER BY INSTNM ASC''')]
 
     def _get_data_types(self):
         """Retrieve data types from the databaes and store them."""
-        self.cur.execute('''
+        self.data_types = [entry[1] for entry in self.cur.execute('''
             PRAGMA table_info(College)''')
-        for entry in self.cur.fetchall():
-            if entry[2] != 'TEXT' and entry[1] != 'college_id':
-                self.data_types.append(entry[1])
+            if entry[2] != 'TEXT' and entry[1] != 'college_id']
         self.max_college_data_index = len(self.data_types) - 1
-        self.cur.execute('''
+        #The year-table columns are kept separately as well, so queries
+        #can qualify each column against the table that defines it.
+        self.year_data_types = [entry[1] for entry in self.cur.execute('''
             PRAGMA table_info("%s")''' % self.year_names[0])
-        for entry in self.cur.fetchall()[1:]: #ignores duplicate 'college_id'
-            if entry[2] != 'TEXT':
-                self.data_types.append(entry[1])
+            if entry[2] != 'TEXT' and entry[1] != 'college_id']
+        self.data_types += self.year_data_types
 
     def _get_year_names(self):
         """Retrieve the valid years from the database and store them."""
-        self.cur.execute('''
+        self.year_names = [item[0] for item in self.cur.execute('''
             SELECT name FROM sqlite_master WHERE type = "table"''')
-        for item in self.cur.fetchall():
-            if item[0] != 'College' and item[0] != 'sqlite_sequence':
-                self.year_names.append(item[0])
+            if item[0] != 'College' and item[0] != 'sqlite_sequence']
 
 class PlotConfigWindow(QtGui.QWidget):
     """Menu for user specification of data to be plotted.
@@ -418,24 +750,22 @@ class SeriesOptions(QtGui.QWidget):
         self.layout = QtGui.QHBoxLayout(self)
         self.parent = parent
 
+        #addItems inserts the whole list in one model update, rather
+        #than one update per entry with per-item addItem calls.
         self.school_box = QtGui.QComboBox()
-        for college in college_names:
-            self.school_box.addItem(college)
+        self.school_box.addItems(college_names)
         self.layout.addWidget(self.school_box)
 
         self.data_box = QtGui.QComboBox()
-        for data_type in data_types:
-            self.data_box.addItem(data_type)
+        self.data_box.addItems(data_types)
         self.layout.addWidget(self.data_box)
 
         self.start_year_box = QtGui.QComboBox()
-        for year in year_names:
-            self.start_year_box.addItem(year)
+        self.start_year_box.addItems(year_names)
         self.layout.addWidget(self.start_year_box)
 
         self.end_year_box = QtGui.QComboBox()
-        for year in year_names:
-            self.end_year_box.addItem(year)
+        self.end_year_box.addItems(year_names)
         self.layout.addWidget(self.end_year_box)
 
         self.remove_box = QtGui.QPushButton('Remove Series')
@@ -472,8 +802,10 @@ class SeriesPlot(object):
         data_type: Data type string.
         start_year: Starting year string.
         end_year: Ending year string.
-        data: List of data from the database for college's data_type between
-            start_year and end_year, inclusive.
+        data: Data from the database for college's data_type between
+            start_year and end_year, inclusive. A NumPy float array with
+            NaN for missing values when the data comes from a year table,
+            or a single-element list for College table data.
     """
 
     def __init__(self, college, data_type, start_year, end_year, is_college):
@@ -485,17 +817,18 @@ class SeriesPlot(object):
         self.data = []
 
     def _get_xy_data(self):
-        """Generates a list of x and y coordinates to be plotted.
+        """Generates the x and y coordinate arrays to be plotted.
 
         Returns:
-            (x_data, y_data): tuple containing list of x values and list of y
-                values
+            (x_data, y_data): tuple containing an array of x values and
+                an array of y values
         """
-        x_data = list(
-            range(int(self.start_year), int(self.end_year) + 1))
-        y_data = []
+        x_data = np.arange(int(self.start_year), int(self.end_year) + 1)
         if self.is_college:
-            y_data = [self.data[0] for val in x_data]
+            #np.full broadcasts the single College value across the year
+            #range; a None value yields an object array that the
+            #missing-data check in _update_figure still recognizes.
+            y_data = np.full(len(x_data), self.data[0])
         else:
             y_data = self.data
         return (x_data, y_data)
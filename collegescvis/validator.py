@@ -16,6 +16,9 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 import json
+import mmap
+
+_ALLOWED_SQL_TYPES = frozenset(('INTEGER', 'REAL', 'TEXT'))
 
 
 class Validator(object):
@@ -49,7 +52,7 @@ class Validator(object):
             if not isinstance(data_type[1], str):
                 raise TypeError(
                     'Second value in', data_type, 'is not a string.')
-            if data_type[1] not in ['INTEGER', 'REAL', 'TEXT']:
+            if data_type[1] not in _ALLOWED_SQL_TYPES:
                 raise ValueError('Data type in', data_type, 'is invalid.')
             if not isinstance(data_type[2], int):
                 raise TypeError(
@@ -60,17 +63,70 @@ class Validator(object):
     def check_raw_data(raw_data_file):
         """Check for correct formatting in the specified raw data file.
 
+        The file is memory mapped so the line and comma totals come from
+        two C-level scans of the mapping. Only when the totals disagree,
+        or when the file object cannot be mapped (e.g. an in-memory
+        file), does the per-line scan run to locate the offending line.
+
         Args:
             raw_data_file: File object of College Scorecard raw data.
 
         Raises:
             ValueError: If the data is incorrectly formatted.
         """
-        raw_data_lines = raw_data_file.readlines()
-        entries = len(raw_data_lines[0].split(','))
-        for line in raw_data_lines:
-            length = len(line.split(','))
-            if length != entries:
+        try:
+            mapped = mmap.mmap(
+                raw_data_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            Validator._check_raw_data_lines(raw_data_file)
+            return
+        with mapped:
+            header_end = mapped.find(b'\n')
+            if header_end == -1:
+                header_end = len(mapped)
+            expected = mapped[:header_end].count(b',')
+            lines = Validator._count_byte(mapped, b'\n')
+            if mapped[-1:] != b'\n':
+                lines += 1
+            if Validator._count_byte(mapped, b',') != expected * lines:
+                Validator._check_raw_data_lines(raw_data_file)
+        raw_data_file.seek(0)
+
+    @staticmethod
+    def _count_byte(mapped, byte):
+        """Count occurrences of a byte in a memory-mapped file.
+
+        mmap objects have no count method, so the mapping is scanned in
+        bounded slices that each count in C.
+
+        Args:
+            mapped: mmap object to scan.
+            byte: Single byte to count.
+
+        Returns:
+            count: Integer number of occurrences in the mapping.
+        """
+        chunk_size = 1 << 24
+        count = 0
+        for start in range(0, len(mapped), chunk_size):
+            count += mapped[start:start + chunk_size].count(byte)
+        return count
+
+    @staticmethod
+    def _check_raw_data_lines(raw_data_file):
+        """Check each raw data line's width, raising on the first mismatch.
+
+        Args:
+            raw_data_file: File object of College Scorecard raw data.
+
+        Raises:
+            ValueError: If a line has the wrong number of entries.
+        """
+        expected = None
+        for line in raw_data_file:
+            if expected is None:
+                expected = line.count(',')
+            elif line.count(',') != expected:
                 raise ValueError(
                     'Incorrect number of entries in raw data line.')
         raw_data_file.seek(0)